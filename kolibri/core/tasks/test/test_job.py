@@ -1,8 +1,9 @@
+import copy
 from datetime import datetime
 from datetime import timedelta
 
 import mock
-from django.test.testcases import TestCase
+import pytest
 
 from kolibri.core.tasks.constants import Priority
 from kolibri.core.tasks.exceptions import JobNotRunning
@@ -17,390 +18,433 @@ def status_fn(job):
     pass
 
 
-class JobTest(TestCase):
-    def setUp(self):
-        self.job = Job(id, track_progress=True)
-        self.job.storage = mock.MagicMock()
-
-    def test_job_save_as_cancellable(self):
-        cancellable = not self.job.cancellable
-
-        self.job.save_as_cancellable(cancellable=cancellable)
-        self.job.storage.save_job_as_cancellable.assert_called_once_with(
-            self.job.job_id, cancellable=cancellable
-        )
-
-    def test_job_save_as_cancellable_sets_cancellable(self):
-        cancellable = not self.job.cancellable
-
-        self.job.save_as_cancellable(cancellable=cancellable)
-        self.assertEqual(self.job.cancellable, cancellable)
-
-    def test_job_update_progress_saves_progress_to_storage(self):
-        self.job.update_progress(0.5, 1.5)
-        self.job.storage.update_job_progress.assert_called_once_with(
-            self.job.job_id, 0.5, 1.5
-        )
-
-    def test_job_update_progress_sets_progress(self):
-        self.job.update_progress(0.5, 1.5)
-        self.assertEqual(self.job.progress, 0.5)
-        self.assertEqual(self.job.total_progress, 1.5)
-
-    def test_job_save_as_cancellable__skip(self):
-        cancellable = self.job.cancellable
-        self.job.save_as_cancellable(cancellable=cancellable)
-        self.job.storage.save_job_as_cancellable.assert_not_called()
-
-    def test_job_save_as_cancellable__no_storage(self):
-        cancellable = not self.job.cancellable
-        self.job.storage = None
-        with self.assertRaises(ReferenceError):
-            self.job.save_as_cancellable(cancellable=cancellable)
-
-    def test_job_retry_in_not_running(self):
-        dt = timedelta(seconds=15)
-        with self.assertRaises(JobNotRunning):
-            self.job.retry_in(dt)
-
-    def test_job_retry_in_running(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        try:
-            self.job.retry_in(dt)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual({}, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-    def test_job_retry_in_unexpected_keyword_argument(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        kwargs = {"invalid_arg": "value"}
-        with self.assertRaises(ValueError):
-            self.job.retry_in(dt, **kwargs)
+_EXPECTED_PERMISSION_TYPES = [IsSuperAdmin]
+
+
+@pytest.fixture
+def job():
+    job = Job(id, track_progress=True)
+    job.storage = mock.MagicMock()
+    return job
+
+
+# Built once per module so the permission class instantiation and
+# priority normalization in RegisteredTask.__init__ only happen once.
+@pytest.fixture(scope="module")
+def _registered_task_template():
+    return RegisteredTask(
+        int,
+        priority=Priority.HIGH,
+        queue="test",
+        permission_classes=[IsSuperAdmin],
+        job_id="test",
+        cancellable=True,
+        track_progress=True,
+        long_running=True,
+        status_fn=status_fn,
+    )
+
+
+@pytest.fixture
+def registered_task(_registered_task_template):
+    # A shallow copy is just a __dict__ copy, and lets a test reassign
+    # attributes without leaking into the shared template.
+    return copy.copy(_registered_task_template)
+
+
+# One fixture in place of the pair of mock.patch decorators that each
+# enqueue test used to stack - monkeypatch does a plain setattr per test
+# rather than rebuilding the patcher machinery for every decorator.
+@pytest.fixture
+def patched_storage_and_ready_job(monkeypatch):
+    job_storage_mock = mock.MagicMock()
+    ready_job_mock = mock.MagicMock()
+    monkeypatch.setattr("kolibri.core.tasks.registry.job_storage", job_storage_mock)
+    monkeypatch.setattr(
+        "kolibri.core.tasks.registry.RegisteredTask._ready_job", ready_job_mock
+    )
+    return job_storage_mock, ready_job_mock
+
+
+def test_job_save_as_cancellable(job):
+    cancellable = not job.cancellable
+
+    job.save_as_cancellable(cancellable=cancellable)
+    job.storage.save_job_as_cancellable.assert_called_once_with(
+        job.job_id, cancellable=cancellable
+    )
+
+
+def test_job_save_as_cancellable_sets_cancellable(job):
+    cancellable = not job.cancellable
+
+    job.save_as_cancellable(cancellable=cancellable)
+    assert job.cancellable == cancellable
+
+
+def test_job_update_progress_saves_progress_to_storage(job):
+    job.update_progress(0.5, 1.5)
+    job.storage.update_job_progress.assert_called_once_with(job.job_id, 0.5, 1.5)
+
+
+def test_job_update_progress_sets_progress(job):
+    job.update_progress(0.5, 1.5)
+    assert job.progress == 0.5
+    assert job.total_progress == 1.5
+
+
+def test_job_save_as_cancellable__skip(job):
+    cancellable = job.cancellable
+    job.save_as_cancellable(cancellable=cancellable)
+    job.storage.save_job_as_cancellable.assert_not_called()
+
+
+def test_job_save_as_cancellable__no_storage(job):
+    cancellable = not job.cancellable
+    job.storage = None
+    with pytest.raises(ReferenceError):
+        job.save_as_cancellable(cancellable=cancellable)
+
+
+def test_job_retry_in_not_running(job):
+    dt = timedelta(seconds=15)
+    with pytest.raises(JobNotRunning):
+        job.retry_in(dt)
+
+
+def test_job_retry_in_running(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    try:
+        job.retry_in(dt)
+        assert job._retry_in_delay == dt
+        assert {} == job._retry_in_kwargs
+    except Exception:
         setattr(current_state_tracker, "job", None)
 
-    def test_job_retry_in_with_priority(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        kwargs = {"priority": Priority.LOW}
-        try:
-            self.job.retry_in(dt, **kwargs)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual(kwargs, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-    def test_job_retry_in_with_repeat(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        kwargs = {"repeat": 3}
-        try:
-            self.job.retry_in(dt, **kwargs)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual(kwargs, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-    def test_job_retry_in_with_interval(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        kwargs = {"interval": 5 * 60}
-        try:
-            self.job.retry_in(dt, **kwargs)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual(kwargs, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-    def test_job_retry_in_with_retry_interval(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        kwargs = {"retry_interval": 60 * 60}
-        try:
-            self.job.retry_in(dt, **kwargs)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual(kwargs, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-    def test_job_retry_in_invalid_priority(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        invalid_priority = "invalid_priority"
-        kwargs = {"priority": invalid_priority}
-        with self.assertRaises(ValueError):
-            self.job.retry_in(dt, **kwargs)
+
+def test_job_retry_in_unexpected_keyword_argument(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    kwargs = {"invalid_arg": "value"}
+    with pytest.raises(ValueError):
+        job.retry_in(dt, **kwargs)
+    setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_with_priority(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    kwargs = {"priority": Priority.LOW}
+    try:
+        job.retry_in(dt, **kwargs)
+        assert job._retry_in_delay == dt
+        assert kwargs == job._retry_in_kwargs
+    except Exception:
+        setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_with_repeat(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    kwargs = {"repeat": 3}
+    try:
+        job.retry_in(dt, **kwargs)
+        assert job._retry_in_delay == dt
+        assert kwargs == job._retry_in_kwargs
+    except Exception:
         setattr(current_state_tracker, "job", None)
 
-    def test_job_retry_in_invalid_interval(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        invalid_interval = -1  # Invalid negative interval
-        kwargs = {"interval": invalid_interval}
-        with self.assertRaises(ValueError):
-            self.job.retry_in(dt, **kwargs)
+
+def test_job_retry_in_with_interval(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    kwargs = {"interval": 5 * 60}
+    try:
+        job.retry_in(dt, **kwargs)
+        assert job._retry_in_delay == dt
+        assert kwargs == job._retry_in_kwargs
+    except Exception:
         setattr(current_state_tracker, "job", None)
 
-    def test_job_retry_in_invalid_retry_interval(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        invalid_retry_interval = 0  # Invalid zero retry interval
-        kwargs = {"retry_interval": invalid_retry_interval}
-        with self.assertRaises(ValueError):
-            self.job.retry_in(dt, **kwargs)
+
+def test_job_retry_in_with_retry_interval(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    kwargs = {"retry_interval": 60 * 60}
+    try:
+        job.retry_in(dt, **kwargs)
+        assert job._retry_in_delay == dt
+        assert kwargs == job._retry_in_kwargs
+    except Exception:
         setattr(current_state_tracker, "job", None)
 
-    def test_job_retry_in_invalid_repeat(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        invalid_repeat = -1  # Invalid negative repeat
-        kwargs = {"repeat": invalid_repeat}
-        with self.assertRaises(ValueError):
-            self.job.retry_in(dt, **kwargs)
+
+def test_job_retry_in_invalid_priority(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    invalid_priority = "invalid_priority"
+    kwargs = {"priority": invalid_priority}
+    with pytest.raises(ValueError):
+        job.retry_in(dt, **kwargs)
+    setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_invalid_interval(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    invalid_interval = -1  # Invalid negative interval
+    kwargs = {"interval": invalid_interval}
+    with pytest.raises(ValueError):
+        job.retry_in(dt, **kwargs)
+    setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_invalid_retry_interval(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    invalid_retry_interval = 0  # Invalid zero retry interval
+    kwargs = {"retry_interval": invalid_retry_interval}
+    with pytest.raises(ValueError):
+        job.retry_in(dt, **kwargs)
+    setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_invalid_repeat(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    invalid_repeat = -1  # Invalid negative repeat
+    kwargs = {"repeat": invalid_repeat}
+    with pytest.raises(ValueError):
+        job.retry_in(dt, **kwargs)
+    setattr(current_state_tracker, "job", None)
+
+
+def test_job_retry_in_all_allowable_values(job):
+    setattr(current_state_tracker, "job", job)
+    dt = timedelta(seconds=15)
+    priority = Priority.HIGH
+    interval = 60 * 5
+    retry_interval = 60 * 60
+    repeat = 3
+    kwargs = {
+        "priority": priority,
+        "interval": interval,
+        "retry_interval": retry_interval,
+        "repeat": repeat,
+    }
+    try:
+        job.retry_in(dt, **kwargs)
+        assert job._retry_in_delay == dt
+        assert kwargs == job._retry_in_kwargs
+    except Exception:
         setattr(current_state_tracker, "job", None)
 
-    def test_job_retry_in_all_allowable_values(self):
-        setattr(current_state_tracker, "job", self.job)
-        dt = timedelta(seconds=15)
-        priority = Priority.HIGH
-        interval = 60 * 5
-        retry_interval = 60 * 60
-        repeat = 3
-        kwargs = {
-            "priority": priority,
-            "interval": interval,
-            "retry_interval": retry_interval,
-            "repeat": repeat,
-        }
-        try:
-            self.job.retry_in(dt, **kwargs)
-            self.assertEqual(self.job._retry_in_delay, dt)
-            self.assertEqual(kwargs, self.job._retry_in_kwargs)
-        except Exception:
-            setattr(current_state_tracker, "job", None)
-
-
-class TestRegisteredTask(TestCase):
-    def setUp(self):
-        self.registered_task = RegisteredTask(
-            int,
-            priority=Priority.HIGH,
-            queue="test",
-            permission_classes=[IsSuperAdmin],
-            job_id="test",
-            cancellable=True,
-            track_progress=True,
-            long_running=True,
-            status_fn=status_fn,
-        )
-
-    def test_constructor_sets_required_params(self):
-        self.assertEqual(self.registered_task.func, int)
-        self.assertEqual(self.registered_task.validator, JobValidator)
-        self.assertEqual(self.registered_task.priority, Priority.HIGH)
-        self.assertIsInstance(self.registered_task.permissions[0], IsSuperAdmin)
-        self.assertEqual(self.registered_task.job_id, "test")
-        self.assertEqual(self.registered_task.queue, "test")
-        self.assertEqual(self.registered_task.cancellable, True)
-        self.assertEqual(self.registered_task.track_progress, True)
-        self.assertEqual(self.registered_task.long_running, True)
-
-    @mock.patch("kolibri.core.tasks.registry.Job", spec=True)
-    def test__ready_job(self, MockJob):
-        result = self.registered_task._ready_job(args=("10",), kwargs=dict(base=10))
-
-        MockJob.assert_called_once_with(
-            self.registered_task,
-            args=("10",),  # arg that was passed to _ready_job()
-            job_id="test",
-            cancellable=True,
-            track_progress=True,
-            long_running=True,
-            kwargs=dict(base=10),  # kwarg that was passed to _ready_job()
-        )
-
-        # Do we return the job object?
-        self.assertIsInstance(result, Job)
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue_in(self, mock_job_storage, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        delta = timedelta(seconds=5)
-
-        self.registered_task.enqueue_in(
-            delta_time=delta,
-            interval=10,
-            repeat=10,
-            args=args,
-            kwargs=kwargs,
-        )
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        mock_job_storage.enqueue_in.assert_called_once_with(
-            delta,
-            "job",
-            queue="test",
-            interval=10,
-            priority=5,
-            repeat=10,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue_in__override_priority(self, mock_job_storage, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        override_priority = 20
-        self.assertNotEqual(self.registered_task.priority, override_priority)
-        delta = timedelta(seconds=5)
-
-        self.registered_task.enqueue_in(
-            delta_time=delta,
-            interval=10,
-            repeat=10,
-            args=args,
-            priority=override_priority,
-            kwargs=kwargs,
-        )
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        mock_job_storage.enqueue_in.assert_called_once_with(
-            delta,
-            "job",
-            queue="test",
-            interval=10,
-            priority=override_priority,
-            repeat=10,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue_at(self, mock_job_storage, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        now = datetime.now()
-
-        self.registered_task.enqueue_at(
-            datetime=now,
-            interval=10,
-            repeat=10,
-            args=args,
-            kwargs=kwargs,
-        )
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        mock_job_storage.enqueue_at.assert_called_once_with(
-            now,
-            "job",
-            queue="test",
-            interval=10,
-            priority=5,
-            repeat=10,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue_at__override_priority(self, mock_job_storage, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        now = datetime.now()
-
-        override_priority = 20
-        self.assertNotEqual(self.registered_task.priority, override_priority)
-
-        self.registered_task.enqueue_at(
-            datetime=now,
-            interval=10,
-            repeat=10,
-            priority=override_priority,
-            args=args,
-            kwargs=kwargs,
-        )
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        mock_job_storage.enqueue_at.assert_called_once_with(
-            now,
-            "job",
-            queue="test",
-            interval=10,
-            priority=override_priority,
-            repeat=10,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue(self, job_storage_mock, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        self.registered_task.enqueue(args=args, kwargs=kwargs)
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        job_storage_mock.enqueue_job.assert_called_once_with(
-            "job",
-            queue=self.registered_task.queue,
-            priority=self.registered_task.priority,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue_lifo_job(self, job_storage_mock, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "lifo_job"
-
-        self.registered_task.enqueue_lifo(args=args, kwargs=kwargs)
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        job_storage_mock.enqueue_lifo.assert_called_once_with(
-            "lifo_job",
-            queue=self.registered_task.queue,
-            priority=self.registered_task.priority,
-            retry_interval=None,
-        )
-
-    @mock.patch("kolibri.core.tasks.registry.RegisteredTask._ready_job")
-    @mock.patch("kolibri.core.tasks.registry.job_storage")
-    def test_enqueue__override_priority(self, job_storage_mock, _ready_job_mock):
-        args = ("10",)
-        kwargs = dict(base=10)
-
-        _ready_job_mock.return_value = "job"
-
-        override_priority = 20
-        self.assertNotEqual(self.registered_task.priority, override_priority)
-        self.registered_task.enqueue(
-            args=args, kwargs=kwargs, priority=override_priority
-        )
-
-        _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
-        job_storage_mock.enqueue_job.assert_called_once_with(
-            "job",
-            queue=self.registered_task.queue,
-            priority=override_priority,
-            retry_interval=None,
-        )
+
+def test_constructor_sets_required_params(registered_task):
+    assert registered_task.func == int
+    assert registered_task.validator == JobValidator
+    assert registered_task.priority == Priority.HIGH
+    assert [type(p) for p in registered_task.permissions] == _EXPECTED_PERMISSION_TYPES
+    assert registered_task.job_id == "test"
+    assert registered_task.queue == "test"
+    assert registered_task.cancellable is True
+    assert registered_task.track_progress is True
+    assert registered_task.long_running is True
+
+
+@mock.patch("kolibri.core.tasks.registry.Job", spec=True)
+def test__ready_job(MockJob, registered_task):
+    result = registered_task._ready_job(args=("10",), kwargs=dict(base=10))
+
+    MockJob.assert_called_once_with(
+        registered_task,
+        args=("10",),  # arg that was passed to _ready_job()
+        job_id="test",
+        cancellable=True,
+        track_progress=True,
+        long_running=True,
+        kwargs=dict(base=10),  # kwarg that was passed to _ready_job()
+    )
+
+    # Do we return the job object?
+    assert isinstance(result, Job)
+
+
+def test_enqueue_in(registered_task, patched_storage_and_ready_job):
+    mock_job_storage, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    delta = timedelta(seconds=5)
+
+    registered_task.enqueue_in(
+        delta_time=delta,
+        interval=10,
+        repeat=10,
+        args=args,
+        kwargs=kwargs,
+    )
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    mock_job_storage.enqueue_in.assert_called_once_with(
+        delta,
+        "job",
+        queue="test",
+        interval=10,
+        priority=5,
+        repeat=10,
+        retry_interval=None,
+    )
+
+
+def test_enqueue_in__override_priority(registered_task, patched_storage_and_ready_job):
+    mock_job_storage, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    override_priority = 20
+    assert registered_task.priority != override_priority
+    delta = timedelta(seconds=5)
+
+    registered_task.enqueue_in(
+        delta_time=delta,
+        interval=10,
+        repeat=10,
+        args=args,
+        priority=override_priority,
+        kwargs=kwargs,
+    )
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    mock_job_storage.enqueue_in.assert_called_once_with(
+        delta,
+        "job",
+        queue="test",
+        interval=10,
+        priority=override_priority,
+        repeat=10,
+        retry_interval=None,
+    )
+
+
+def test_enqueue_at(registered_task, patched_storage_and_ready_job):
+    mock_job_storage, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    now = datetime.now()
+
+    registered_task.enqueue_at(
+        datetime=now,
+        interval=10,
+        repeat=10,
+        args=args,
+        kwargs=kwargs,
+    )
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    mock_job_storage.enqueue_at.assert_called_once_with(
+        now,
+        "job",
+        queue="test",
+        interval=10,
+        priority=5,
+        repeat=10,
+        retry_interval=None,
+    )
+
+
+def test_enqueue_at__override_priority(registered_task, patched_storage_and_ready_job):
+    mock_job_storage, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    now = datetime.now()
+
+    override_priority = 20
+    assert registered_task.priority != override_priority
+
+    registered_task.enqueue_at(
+        datetime=now,
+        interval=10,
+        repeat=10,
+        priority=override_priority,
+        args=args,
+        kwargs=kwargs,
+    )
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    mock_job_storage.enqueue_at.assert_called_once_with(
+        now,
+        "job",
+        queue="test",
+        interval=10,
+        priority=override_priority,
+        repeat=10,
+        retry_interval=None,
+    )
+
+
+def test_enqueue(registered_task, patched_storage_and_ready_job):
+    job_storage_mock, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    registered_task.enqueue(args=args, kwargs=kwargs)
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    job_storage_mock.enqueue_job.assert_called_once_with(
+        "job",
+        queue=registered_task.queue,
+        priority=registered_task.priority,
+        retry_interval=None,
+    )
+
+
+def test_enqueue_lifo_job(registered_task, patched_storage_and_ready_job):
+    job_storage_mock, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "lifo_job"
+
+    registered_task.enqueue_lifo(args=args, kwargs=kwargs)
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    job_storage_mock.enqueue_lifo.assert_called_once_with(
+        "lifo_job",
+        queue=registered_task.queue,
+        priority=registered_task.priority,
+        retry_interval=None,
+    )
+
+
+def test_enqueue__override_priority(registered_task, patched_storage_and_ready_job):
+    job_storage_mock, _ready_job_mock = patched_storage_and_ready_job
+    args = ("10",)
+    kwargs = dict(base=10)
+
+    _ready_job_mock.return_value = "job"
+
+    override_priority = 20
+    assert registered_task.priority != override_priority
+    registered_task.enqueue(args=args, kwargs=kwargs, priority=override_priority)
+
+    _ready_job_mock.assert_called_once_with(args=args, kwargs=kwargs)
+    job_storage_mock.enqueue_job.assert_called_once_with(
+        "job",
+        queue=registered_task.queue,
+        priority=override_priority,
+        retry_interval=None,
+    )
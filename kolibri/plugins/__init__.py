@@ -106,20 +106,15 @@ class ConfigDict(dict):
         self.save()
 
     def clear_plugin(self, module_path):
+        self.clear_plugins((module_path,))
+
+    def clear_plugins(self, module_paths):
         # Clean up references to plugins that either don't exist
-        # Or don't import properly.
-        try:
-            self["INSTALLED_PLUGINS"].remove(module_path)
-        except KeyError:
-            pass
-        try:
-            self["DISABLED_PLUGINS"].remove(module_path)
-        except KeyError:
-            pass
-        try:
-            self["UPDATED_PLUGINS"].remove(module_path)
-        except KeyError:
-            pass
+        # Or don't import properly, saving the config file only once.
+        for module_path in module_paths:
+            self["INSTALLED_PLUGINS"].discard(module_path)
+            self["DISABLED_PLUGINS"].discard(module_path)
+            self["UPDATED_PLUGINS"].discard(module_path)
         self.save()
 
     def update_plugin_version(self, module_path, new_version):
@@ -32,11 +32,22 @@ from kolibri.plugins import KolibriPluginBase
 from kolibri.plugins.hooks import KolibriHook
 from kolibri.utils.compat import module_exists
 from kolibri.utils.conf import KOLIBRI_HOME
+from kolibri.utils.lru_cache import lru_cache
 from kolibri.utils.version import normalize_version_to_semver
 
 logger = logging.getLogger(__name__)
 
 
+# Cache of plugin objects that have already been initialized, keyed by plugin
+# name, mapping to a tuple of the plugin object and whether its hooks have been
+# registered. Plugins that are known not to exist are tracked in a separate
+# cache, so that operations that are invoked per-plugin, such as CLI enabling
+# and disabling, do not repeat the import machinery work for every call.
+_plugin_cache = {}
+
+_unavailable_plugin_cache = {}
+
+
 class PluginDoesNotExist(Exception):
     """
     This exception is raised when a plugin is initialized but it has no plugin class
@@ -58,17 +69,7 @@ class MultiplePlugins(Exception):
 
 
 def plugin_url(plugin_class, url_name):
-    return reverse(
-        "kolibri:{namespace}:{url_name}".format(
-            namespace=plugin_class.class_module_path(), url_name=url_name
-        )
-    )
-
-
-def _is_plugin(class_definition):
-    return isinstance(class_definition, type) and issubclass(
-        class_definition, KolibriPluginBase
-    )
+    return reverse(f"kolibri:{plugin_class.class_module_path()}:{url_name}")
 
 
 def is_external_plugin(module_path):
@@ -82,27 +83,19 @@ def is_external_plugin(module_path):
     return not module_path.startswith("kolibri.")
 
 
-def _import_python_module(plugin_name):
-    try:
-        importlib.import_module(plugin_name)
-    except ImportError as e:
-        exc_message = str(e)
-        if exc_message.startswith("No module named"):
-            msg = (
-                "Plugin '{}' does not seem to exist. Is it on the PYTHONPATH?"
-            ).format(plugin_name)
-            raise PluginDoesNotExist(msg)
-        else:
-            raise
-
-
 def initialize_plugins_and_hooks(all_classes, plugin_name, initialize_hooks=True):
     was_configured = django_settings.configured
-    plugin_objects = []
+    plugin_instance = None
     for class_definition in all_classes:
-        if _is_plugin(class_definition):
+        # The caller has already filtered all_classes down to classes, so
+        # only the subclass check from the old _is_plugin helper remains.
+        if issubclass(class_definition, KolibriPluginBase):
+            if plugin_instance is not None:
+                raise MultiplePlugins(
+                    "More than one plugin defined in kolibri_plugin module"
+                )
             # Initialize the class, nothing more happens for now.
-            plugin_objects.append(class_definition())
+            plugin_instance = class_definition()
             if not was_configured and django_settings.configured:
                 raise PluginLoadsApp(
                     "Initializing plugin class {} in plugin {} caused Django settings to be configured".format(
@@ -117,19 +110,14 @@ def initialize_plugins_and_hooks(all_classes, plugin_name, initialize_hooks=True
                         class_definition.__name__, plugin_name
                     )
                 )
-    if len(plugin_objects) == 0:
+    if plugin_instance is None:
         raise PluginDoesNotExist(
             "Plugin '{}' exists but does not define a KolibriPluginBase derived class".format(
                 plugin_name
             )
         )
-    if len(plugin_objects) == 1:
-        plugin_instance = plugin_objects[0]
-        logger.debug("Initializing plugin: {}".format(plugin_name))
-        return plugin_instance
-
-    if len(plugin_objects) > 1:
-        raise MultiplePlugins("More than one plugin defined in kolibri_plugin module")
+    logger.debug("Initializing plugin: {}".format(plugin_name))
+    return plugin_instance
 
 
 def initialize_kolibri_plugin(plugin_name, initialize_hooks=True):
@@ -143,16 +131,43 @@ def initialize_kolibri_plugin(plugin_name, initialize_hooks=True):
 
     :returns: the KolibriPlugin object for the module
     """
-    was_configured = django_settings.configured
+    if plugin_name in _unavailable_plugin_cache:
+        raise PluginDoesNotExist(_unavailable_plugin_cache[plugin_name])
+
+    plugin_object, hooks_initialized = _plugin_cache.get(plugin_name, (None, False))
+    if plugin_object is not None and (hooks_initialized or not initialize_hooks):
+        return plugin_object
+
+    try:
+        plugin_object = _initialize_kolibri_plugin(
+            plugin_name, initialize_hooks=initialize_hooks
+        )
+    except PluginDoesNotExist as e:
+        _unavailable_plugin_cache[plugin_name] = str(e)
+        raise
+    _plugin_cache[plugin_name] = (
+        plugin_object,
+        hooks_initialized or initialize_hooks,
+    )
+    return plugin_object
 
-    # First import the bare plugin name to see if it exists
-    # This will raise an exception if not
-    _import_python_module(plugin_name)
+
+def _initialize_kolibri_plugin(plugin_name, initialize_hooks=True):
+    was_configured = django_settings.configured
 
     plugin_module_name = plugin_name + ".kolibri_plugin"
+    modules = sys.modules
     try:
+        # Peek sys.modules before each import - an already imported module
+        # skips the full import machinery, including its lock acquisition.
+        if plugin_name not in modules:
+            # First import the bare plugin name to see if it exists
+            # This will raise an exception if not
+            importlib.import_module(plugin_name)
         # Exceptions are expected to be thrown from here.
-        plugin_module = importlib.import_module(plugin_module_name)
+        plugin_module = modules.get(plugin_module_name)
+        if plugin_module is None:
+            plugin_module = importlib.import_module(plugin_module_name)
         if not was_configured and django_settings.configured:
             raise PluginLoadsApp(
                 "Importing plugin module {} caused Django settings to be configured".format(
@@ -164,42 +179,47 @@ def initialize_kolibri_plugin(plugin_name, initialize_hooks=True):
         # Load a list of all class types in module
         # Filter the list to only match the ones that belong to the module
         # and not the ones that have been imported
-        plugin_package = (
-            plugin_module.__package__
-            if plugin_module.__package__
-            else plugin_module.__name__.rpartition(".")[0]
-        )
-
-        def is_plugin_module(x):
-            return (
-                hasattr(x, "__module__")
-                and plugin_package + ".kolibri_plugin" == x.__module__
-            )
-
+        target_module = (
+            plugin_module.__package__ or plugin_module.__name__.rpartition(".")[0]
+        ) + ".kolibri_plugin"
+
+        # Check __module__ before isinstance - isinstance inspects __class__,
+        # which on lazy objects (such as the lazily evaluated options that
+        # plugin modules may import) forces their evaluation.
+        # Snapshot the module attributes up front - a tuple iterates faster
+        # than a dict values view, and is immune to the module dict changing
+        # size if instantiating a class imports something as a side effect.
+        module_values = tuple(vars(plugin_module).values())
         all_classes = [
             cls
-            for cls in plugin_module.__dict__.values()
-            if is_plugin_module(cls) and isinstance(cls, type)
+            for cls in module_values
+            if getattr(cls, "__module__", None) == target_module
+            and isinstance(cls, type)
         ]
         return initialize_plugins_and_hooks(
             all_classes, plugin_name, initialize_hooks=initialize_hooks
         )
 
     except ImportError as e:
-        # Python 2: message, Python 3: msg
-        exc_message = getattr(e, "message", getattr(e, "msg", None))
-        # On Python 3, the message is the full path to the module
-        # On Python 2, the message is the last part of the path
-        if (
-            exc_message == "No module named '{}'".format(plugin_module_name)
-            or exc_message == "No module named kolibri_plugin"
+        # ModuleNotFoundError.name identifies exactly which module was
+        # missing, so no string matching on the error message is needed.
+        # Only genuinely missing modules raise ModuleNotFoundError - a
+        # failed from-import inside the plugin raises a plain ImportError
+        # whose name is the package imported from, and must propagate.
+        missing = e.name if isinstance(e, ModuleNotFoundError) else None
+        if missing is not None and (
+            missing == plugin_name or plugin_name.startswith(missing + ".")
         ):
+            msg = (
+                "Plugin '{}' does not seem to exist. Is it on the PYTHONPATH?"
+            ).format(plugin_name)
+            raise PluginDoesNotExist(msg)
+        if missing == plugin_module_name:
             msg = (
                 "Plugin '{}' exists but does not have an importable kolibri_plugin module"
             ).format(plugin_name)
             raise PluginDoesNotExist(msg)
-        else:
-            raise
+        raise
     except AppRegistryNotReady:
         msg = (
             "Plugin '{}' loads the Django app registry, which it isn't "
@@ -414,20 +434,27 @@ def autoremove_unavailable_plugins():
 
     if is_initialized():
         raise RuntimeError("Attempted to update plugins when registry is initialized")
-    changed = False
-    # Iterate over a copy of the set so that it is not modified during the loop
-    for module_path in config["INSTALLED_PLUGINS"].copy():
-        if not module_exists(module_path):
-            config.clear_plugin(module_path)
-            logger.error(
-                (
-                    "Plugin {mod} not found and disabled. To re-enable it, run:\n"
-                    "   $ kolibri plugin {mod} enable"
-                ).format(mod=module_path)
-            )
-            changed = True
-    if changed:
-        config.save()
+    # Modules that have already been imported are trivially available, and the
+    # default plugins ship with Kolibri itself, so only the remainder need the
+    # slower find_spec based check in module_exists.
+    already_loaded = set(sys.modules)
+    missing_plugins = [
+        module_path
+        for module_path in config["INSTALLED_PLUGINS"]
+        if module_path not in already_loaded
+        and module_path not in DEFAULT_PLUGINS
+        and not module_exists(module_path)
+    ]
+    if not missing_plugins:
+        return
+    for module_path in missing_plugins:
+        logger.error(
+            (
+                "Plugin {mod} not found and disabled. To re-enable it, run:\n"
+                "   $ kolibri plugin {mod} enable"
+            ).format(mod=module_path)
+        )
+    config.clear_plugins(missing_plugins)
 
 
 def enable_new_default_plugins():
@@ -441,27 +468,33 @@ def enable_new_default_plugins():
 
     if is_initialized():
         raise RuntimeError("Attempted to update plugins when registry is initialized")
-    changed = False
-    for module_path in DEFAULT_PLUGINS:
-        if module_path not in config["INSTALLED_PLUGINS"]:
-            config["INSTALLED_PLUGINS"].add(module_path)
-            # Can be migrated to upgrade only logic
-            if module_path not in config["DISABLED_PLUGINS"]:
-                logger.warning(
-                    (
-                        "Default plugin {mod} not found in configuration. To re-disable it, run:\n"
-                        "   $ kolibri plugin {mod} disable"
-                    ).format(mod=module_path)
-                )
-            changed = True
+    new_plugins = frozenset(DEFAULT_PLUGINS) - config["INSTALLED_PLUGINS"]
+    if not new_plugins:
+        return
+    config["INSTALLED_PLUGINS"].update(new_plugins)
+    # Can be migrated to upgrade only logic
+    for module_path in new_plugins - config["DISABLED_PLUGINS"]:
+        logger.warning(
+            (
+                "Default plugin {mod} not found in configuration. To re-disable it, run:\n"
+                "   $ kolibri plugin {mod} disable"
+            ).format(mod=module_path)
+        )
+    config.save()
+
+
+_LEGACY_CONF_FILE = os.path.join(KOLIBRI_HOME, "kolibri_settings.json")
+
 
-    if changed:
-        config.save()
+@lru_cache()
+def _is_pre_0_13(version):
+    # Version parsing is pure, so the result can be memoized per version
+    return matches_version(version, "<0.13.0")
 
 
 def check_plugin_config_file_location(version):
-    if matches_version(version, "<0.13.0"):
-        old_conf_file = os.path.join(KOLIBRI_HOME, "kolibri_settings.json")
+    if _is_pre_0_13(version):
+        old_conf_file = _LEGACY_CONF_FILE
         if os.path.exists(old_conf_file):
             if not os.path.exists(conf_file):
                 shutil.move(old_conf_file, conf_file)
@@ -11,5 +11,6 @@ def module_exists(module_path):
 
     try:
         return find_spec(module_path) is not None
-    except ImportError:
+    except (ImportError, ValueError):
+        # ValueError is raised when a parent package's __spec__ is None
         return False
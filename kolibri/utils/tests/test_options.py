@@ -41,7 +41,7 @@ def activate_log_logger(monkeypatch):
     del LOG_LOGGER[:]
 
 
-def test_option_reading_and_precedence_rules():
+def test_option_reading_and_precedence_rules(monkeypatch):
     """
     Checks that options can be read from a dummy options.ini file, and overridden by env vars.
     """
@@ -86,15 +86,13 @@ def test_option_reading_and_precedence_rules():
         assert OPTIONS["Deployment"]["HTTP_PORT"] == _HTTP_PORT_ENV
 
     # when a higher precedence env var is set, it overrides the lower precedence env var
-    with mock.patch.dict(
-        os.environ,
-        {"KOLIBRI_HTTP_PORT": str(_HTTP_PORT_ENV), "KOLIBRI_LISTEN_PORT": "64000"},
-    ):
-        OPTIONS = options.read_options_file(ini_filename=tmp_ini_path)
-        assert OPTIONS["Deployment"]["HTTP_PORT"] == _HTTP_PORT_ENV
+    monkeypatch.setenv("KOLIBRI_HTTP_PORT", str(_HTTP_PORT_ENV))
+    monkeypatch.setenv("KOLIBRI_LISTEN_PORT", "64000")
+    OPTIONS = options.read_options_file(ini_filename=tmp_ini_path)
+    assert OPTIONS["Deployment"]["HTTP_PORT"] == _HTTP_PORT_ENV
 
 
-def test_default_envvar_generation():
+def test_default_envvar_generation(monkeypatch):
     """
     Checks that options can be read from a dummy options.ini file, and overridden by env vars.
     """
@@ -106,12 +104,9 @@ def test_default_envvar_generation():
     _, tmp_ini_path = tempfile.mkstemp(prefix="options", suffix=".ini")
 
     # when an env var is set, use those instead of ini file values
-    with mock.patch.dict(
-        os.environ,
-        {"KOLIBRI_CONTENT_DIR": _CONTENT_DIR},
-    ):
-        OPTIONS = options.read_options_file(ini_filename=tmp_ini_path)
-        assert OPTIONS["Paths"]["CONTENT_DIR"] == _CONTENT_DIR
+    monkeypatch.setenv("KOLIBRI_CONTENT_DIR", _CONTENT_DIR)
+    OPTIONS = options.read_options_file(ini_filename=tmp_ini_path)
+    assert OPTIONS["Paths"]["CONTENT_DIR"] == _CONTENT_DIR
 
 
 def test_improper_settings_display_errors_and_exit(monkeypatch):
@@ -241,9 +236,9 @@ def test_deprecated_aliases_envvars(monkeypatch):
         # envvars for deprecated aliases of otherwise valid options log warnings
         with open(tmp_ini_path, "w") as f:
             f.write("\n")
-        with mock.patch.dict(os.environ, {"KOLIBRI_CACHE_REDIS_MIN_DB": "1234"}):
-            options.read_options_file(ini_filename=tmp_ini_path)
-            assert any("deprecated" in msg[1] for msg in LOG_LOGGER)
+        monkeypatch.setenv("KOLIBRI_CACHE_REDIS_MIN_DB", "1234")
+        options.read_options_file(ini_filename=tmp_ini_path)
+        assert any("deprecated" in msg[1] for msg in LOG_LOGGER)
 
 
 def test_option_writing():